@@ -3,7 +3,7 @@ import os
 from dotenv import load_dotenv
 
 from processor import FragmentsProcessor
-from types_ import DataFolderConfig, OpenAIConfig
+from types_ import DataFolderConfig, OpenAIConfig, RateLimitsConfig
 
 def main():
     load_dotenv()
@@ -26,6 +26,25 @@ def main():
     }
 
     processor = FragmentsProcessor(folders_config, openai_config, export_logs = True)
+
+    if os.environ.get('DRY_RUN', '').lower() in ('1', 'true'):
+        rate_limits: RateLimitsConfig = {
+            'requests_per_minute': int(os.environ.get('RATE_LIMIT_RPM', 3500)),
+            'tokens_per_minute': int(os.environ.get('RATE_LIMIT_TPM', 90000)),
+            'concurrency': int(os.environ.get('CONCURRENCY', 1)),
+            'average_request_seconds': float(os.environ.get('AVERAGE_REQUEST_SECONDS', 5)),
+        }
+
+        embedding_rate_limits: RateLimitsConfig = {
+            'requests_per_minute': int(os.environ.get('EMBEDDING_RATE_LIMIT_RPM', 3000)),
+            'tokens_per_minute': int(os.environ.get('EMBEDDING_RATE_LIMIT_TPM', 1000000)),
+            'concurrency': int(os.environ.get('EMBEDDING_CONCURRENCY', 1)),
+            'average_request_seconds': float(os.environ.get('EMBEDDING_AVERAGE_REQUEST_SECONDS', 0.5)),
+        }
+
+        processor.plan_fragments_from_file(os.environ.get('INPUT_FILE'), rate_limits, embedding_rate_limits)
+        return
+
     fragments = processor.generate_fragments_from_file(os.environ.get('INPUT_FILE'))
     processor.export_fragments(fragments)
 
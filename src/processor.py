@@ -1,9 +1,10 @@
 import json
 import logging
 import os
-import textwrap
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 from io import TextIOWrapper
 from typing import List, Tuple, Type, TypeVar
 from urllib.parse import urlparse
@@ -20,15 +21,23 @@ from types_ import (
     ChatCompletionRequest,
     ChatCompletionResponse,
     DataFolderConfig,
+    DryRunPlanData,
     ElementType,
     FragmentData,
     OpenAIConfig,
     OpenAIModelsConfig,
+    RateLimitsConfig,
 )
 from utils import (
     FileManager,
+    estimate_run_time_in_seconds,
+    get_chunks_token_lengths_from_text,
+    get_encoding_name_for_model,
     get_token_length_from_text,
+    get_token_lengths_from_texts,
+    get_tokens_distribution,
     get_fragment_extraction_prompt_for_text,
+    split_text_into_chunks,
 )
 
 T = TypeVar('T')
@@ -36,6 +45,9 @@ T = TypeVar('T')
 class FragmentsProcessor:
     MAX_TOKENS_TO_SEND = 1500
     MAX_RELATED_FRAGMENTS = 3
+    # Aproximación de los tokens que OpenAI agrega a cada request de chat: 3 por mensaje, 1 por el rol y 3 por la preparación
+    # de la respuesta, según la guía de conteo de tokens de OpenAI para gpt-3.5-turbo-0613. No está calibrado contra `usage.prompt_tokens`.
+    CHAT_REQUEST_OVERHEAD_TOKENS = 7
 
     def __init__(self, folder_paths: DataFolderConfig, openai_config: OpenAIConfig, export_logs: bool = False):
         openai.api_key = openai_config['api_key']
@@ -84,6 +96,99 @@ class FragmentsProcessor:
 
         return fragments
 
+    def plan_fragments_from_file(
+        self,
+        file_with_extension: str,
+        rate_limits: RateLimitsConfig,
+        embedding_rate_limits: RateLimitsConfig,
+    ) -> DryRunPlanData:
+        """
+            Simula la generación de fragmentos del archivo especificado sin realizar requests a OpenAI. Calcula los tokens
+            de cada artículo en paralelo, aplica las mismas reglas de separación en chunks que `generate_fragment_from_element`
+            y estima la cantidad de requests, tokens y el tiempo de ejecución según los límites especificados.
+
+            Args:
+                file_with_extension: El nombre del archivo a planificar, ubicado en la carpeta de input.
+                rate_limits: Los límites de requests y tokens por minuto, la concurrencia y la duración promedio de cada request
+                    para el modelo base (chat).
+                embedding_rate_limits: Los mismos límites para el modelo de embeddings.
+
+            Returns:
+                Un diccionario con el resumen de la planificación.
+        """
+
+        absolute_file_path = os.path.normpath(os.path.join(self.folders_config['input_path'], file_with_extension))
+        elements = self.get_sanitized_elements_from_file(absolute_file_path, (ElementType.ARTICLE.value, ArticleElement))
+        texts: List[str] = [element['text'] for element in elements]
+
+        self.logger.info(f'Dry run: se han encontrado {len(elements)} elementos para planificar.')
+
+        texts_tokens = get_token_lengths_from_texts(texts, self.models['base'])
+
+        requests_text_tokens: List[int] = []
+        texts_to_split: List[str] = []
+
+        for text, text_tokens in zip(texts, texts_tokens):
+            if text_tokens > self.MAX_TOKENS_TO_SEND:
+                texts_to_split.append(text)
+            else:
+                requests_text_tokens.append(text_tokens)
+
+        if len(texts_to_split) > 0:
+            # La separación en chunks se realiza en Python puro, por lo que se distribuye entre procesos para utilizar todos los núcleos.
+            split_and_count = partial(get_chunks_token_lengths_from_text, max_tokens = self.MAX_TOKENS_TO_SEND, model = self.models['base'])
+
+            with ProcessPoolExecutor() as executor:
+                chunksize = max(len(texts_to_split) // ((os.cpu_count() or 1) * 4), 1)
+
+                for chunks_tokens in executor.map(split_and_count, texts_to_split, chunksize = chunksize):
+                    requests_text_tokens.extend(chunks_tokens)
+
+        # Tokens fijos de cada request: instrucción del prompt, definición de la función y formato del mensaje.
+        # OpenAI no serializa las funciones como JSON, por lo que `json.dumps` es sólo una aproximación (tiende a sobrestimar).
+        empty_prompt = get_fragment_extraction_prompt_for_text(self.models['base'], '')
+        request_overhead_tokens = (
+            get_token_length_from_text(empty_prompt['messages'][0]['content'], self.models['base'])
+            + get_token_length_from_text(json.dumps(empty_prompt['functions']), self.models['base'])
+            + self.CHAT_REQUEST_OVERHEAD_TOKENS
+        )
+
+        requests_tokens = [text_tokens + request_overhead_tokens for text_tokens in requests_text_tokens]
+        prompt_tokens = sum(requests_tokens)
+
+        # Se reutiliza el conteo anterior cuando ambos modelos comparten la misma codificación.
+        if get_encoding_name_for_model(self.models['embedding']) == get_encoding_name_for_model(self.models['base']):
+            embedding_tokens = sum(texts_tokens)
+        else:
+            embedding_tokens = sum(get_token_lengths_from_texts(texts, self.models['embedding']))
+
+        completion_seconds, completion_bottleneck = estimate_run_time_in_seconds(len(requests_tokens), prompt_tokens, rate_limits)
+        embedding_seconds, embedding_bottleneck = estimate_run_time_in_seconds(len(texts), embedding_tokens, embedding_rate_limits)
+
+        plan: DryRunPlanData = {
+            'articles': len(texts),
+            'chunked_articles': len(texts_to_split),
+            'completion_requests': len(requests_tokens),
+            'embedding_requests': len(texts),
+            'prompt_tokens': prompt_tokens,
+            'embedding_tokens': embedding_tokens,
+            'prompt_tokens_distribution': get_tokens_distribution(requests_tokens),
+            'estimated_completion_seconds': completion_seconds,
+            'estimated_embedding_seconds': embedding_seconds,
+            'estimated_seconds': completion_seconds + embedding_seconds,
+            'completion_bottleneck': completion_bottleneck,
+            'embedding_bottleneck': embedding_bottleneck,
+        }
+
+        distribution = plan['prompt_tokens_distribution']
+
+        self.logger.info(f'Dry run: {plan["articles"]} artículos, {plan["chunked_articles"]} superan el límite de tokens ({self.MAX_TOKENS_TO_SEND}).')
+        self.logger.info(f'Dry run: {plan["completion_requests"]} requests de chat ({plan["prompt_tokens"]} tokens de prompt) y {plan["embedding_requests"]} requests de embeddings ({plan["embedding_tokens"]} tokens).')
+        self.logger.info(f'Dry run: tokens por request min = {distribution["min"]}, p50 = {distribution["p50"]}, p90 = {distribution["p90"]}, p99 = {distribution["p99"]}, max = {distribution["max"]}, promedio = {distribution["mean"]:.1f}')
+        self.logger.info(f'Dry run: tiempo estimado = {plan["estimated_seconds"]:.0f}s (chat = {completion_seconds:.0f}s, límite determinante = {completion_bottleneck}; embeddings = {embedding_seconds:.0f}s, límite determinante = {embedding_bottleneck})')
+
+        return plan
+
     def generate_fragment_from_element(self, element: Type[T], id: int) -> FragmentData:
         fragment_data: FragmentData = {}
         fragment_data['id'] = id
@@ -93,9 +198,7 @@ class FragmentsProcessor:
         tokens_to_send = get_token_length_from_text(element['text'], self.models['base'])
 
         if tokens_to_send > self.MAX_TOKENS_TO_SEND:
-            # Como regla general especificada por OpenAI, un token corresponde aproximadamente a 4 caracteres.
-            # En este caso se utiliza esa relación para poder separar el texto en partes de acuerdo al máximo de tokens especificado.
-            text_chunks = textwrap.wrap(element['text'], self.MAX_TOKENS_TO_SEND * 4)
+            text_chunks = split_text_into_chunks(element['text'], self.MAX_TOKENS_TO_SEND)
 
             self.logger.debug(f'Elemento con ID {id} supera el límite de tokens ({tokens_to_send} / max = {self.MAX_TOKENS_TO_SEND}). Chunks = {len(text_chunks)}')
 
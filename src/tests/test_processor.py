@@ -11,6 +11,12 @@ sys.path.append('../')
 
 from processor import FragmentsProcessor
 from types_ import DataFolderConfig, OpenAIConfig
+from utils import (
+    estimate_run_time_in_seconds,
+    get_token_length_from_text,
+    get_tokens_distribution,
+    split_text_into_chunks,
+)
 
 def generate_random_elements(count: int, output_file_path: str) -> dict:
     elements = []
@@ -159,4 +165,86 @@ class TestFragmentsProcessor(unittest.TestCase):
 
             for field in expected_fields:
                 if fragment.get(field) is None:
-                    raise Exception(f'Campo {field} no encontrado en fragmento generado.')
\ No newline at end of file
+                    raise Exception(f'Campo {field} no encontrado en fragmento generado.')
+
+    def test_fragments_plan_from_file(self):
+        """ La planificación (dry run) debe contar una request de chat por chunk y una de embeddings por artículo. """
+
+        input_file_path = os.path.normpath(os.path.join(self.test_data_folder_path, 'coherent_elements.jsonl'))
+        elements = self.fragment_processor.get_sanitized_elements_from_file(input_file_path, ('article', Any))
+
+        max_tokens = self.fragment_processor.MAX_TOKENS_TO_SEND
+        base_model = os.environ.get('BASE_TEST_MODEL')
+        long_texts = [element['text'] for element in elements if get_token_length_from_text(element['text'], base_model) > max_tokens]
+        expected_completion_requests = (len(elements) - len(long_texts)) + sum(len(split_text_into_chunks(text, max_tokens)) for text in long_texts)
+
+        plan = self.fragment_processor.plan_fragments_from_file('coherent_elements.jsonl', {
+            'requests_per_minute': 60,
+            'tokens_per_minute': 0,
+            'concurrency': 1,
+            'average_request_seconds': 0,
+        }, {
+            'requests_per_minute': 0,
+            'tokens_per_minute': 0,
+            'concurrency': 1,
+            'average_request_seconds': 1,
+        })
+
+        self.assertEqual(plan['articles'], len(elements), 'Se deben planificar todos los artículos del archivo.')
+        self.assertGreater(plan['chunked_articles'], 0, 'El archivo de prueba contiene artículos que superan el límite de tokens.')
+        self.assertEqual(plan['chunked_articles'], len(long_texts))
+        self.assertEqual(plan['completion_requests'], expected_completion_requests, 'Se debe realizar una request de chat por chunk.')
+        self.assertEqual(plan['embedding_requests'], len(elements), 'Se debe realizar una request de embeddings por artículo.')
+        self.assertEqual(plan['completion_bottleneck'], 'requests_per_minute', 'El límite determinante del chat debe ser el de requests por minuto.')
+        self.assertEqual(plan['embedding_bottleneck'], 'concurrency', 'El límite determinante de embeddings debe ser la concurrencia.')
+        self.assertAlmostEqual(plan['estimated_completion_seconds'], plan['completion_requests'], msg = 'Con 60 RPM cada request debe tomar un segundo.')
+        self.assertAlmostEqual(plan['estimated_embedding_seconds'], plan['embedding_requests'], msg = 'Cada request de embeddings debe tomar un segundo.')
+        self.assertLessEqual(plan['prompt_tokens_distribution']['p50'], plan['prompt_tokens_distribution']['max'])
+
+class TestProcessorUtils(unittest.TestCase):
+    """ Tests para las funciones de utilidad de la planificación. No requieren acceso a la API de OpenAI. """
+
+    def test_tokens_distribution_from_empty_input(self):
+        """ La distribución de una lista vacía debe ser cero en todos sus campos. """
+
+        distribution = get_tokens_distribution([])
+
+        self.assertEqual(distribution, { 'min': 0, 'max': 0, 'mean': 0.0, 'p50': 0, 'p90': 0, 'p99': 0 })
+
+    def test_tokens_distribution_nearest_rank_percentiles(self):
+        """ Los percentiles deben calcularse mediante el método de rango más cercano. """
+
+        distribution = get_tokens_distribution(list(range(100, 0, -1)))
+
+        self.assertEqual(distribution['min'], 1)
+        self.assertEqual(distribution['max'], 100)
+        self.assertAlmostEqual(distribution['mean'], 50.5)
+        self.assertEqual(distribution['p50'], 50)
+        self.assertEqual(distribution['p90'], 90)
+        self.assertEqual(distribution['p99'], 99)
+
+        distribution = get_tokens_distribution([10, 20, 30])
+
+        self.assertEqual(distribution['p50'], 20)
+        self.assertEqual(distribution['p90'], 30)
+        self.assertEqual(distribution['p99'], 30)
+
+    def test_run_time_estimation_bottlenecks(self):
+        """ El tiempo estimado debe corresponder al límite más restrictivo. """
+
+        rate_limits = { 'requests_per_minute': 60, 'tokens_per_minute': 6000, 'concurrency': 2, 'average_request_seconds': 1 }
+
+        self.assertEqual(estimate_run_time_in_seconds(120, 100, rate_limits), (120.0, 'requests_per_minute'))
+        self.assertEqual(estimate_run_time_in_seconds(10, 60000, rate_limits), (600.0, 'tokens_per_minute'))
+
+        rate_limits['average_request_seconds'] = 10
+
+        self.assertEqual(estimate_run_time_in_seconds(60, 100, rate_limits), (300.0, 'concurrency'))
+
+    def test_run_time_estimation_without_limits(self):
+        """ Los límites iguales a 0 o no especificados deben considerarse ilimitados. """
+
+        zero_limits = { 'requests_per_minute': 0, 'tokens_per_minute': 0, 'concurrency': 0, 'average_request_seconds': 5 }
+
+        self.assertEqual(estimate_run_time_in_seconds(100, 1000, zero_limits), (0.0, 'none'))
+        self.assertEqual(estimate_run_time_in_seconds(100, 1000, {}), (0.0, 'none'))
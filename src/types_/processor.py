@@ -39,4 +39,32 @@ class FragmentData(TypedDict):
     original_reference: str
     content: str
     related_fragments: List[int]
-    related_fragments_titles: List[str]
\ No newline at end of file
+    related_fragments_titles: List[str]
+
+class RateLimitsConfig(TypedDict):
+    requests_per_minute: int
+    tokens_per_minute: int
+    concurrency: int
+    average_request_seconds: float
+
+class TokenDistributionData(TypedDict):
+    min: int
+    max: int
+    mean: float
+    p50: int
+    p90: int
+    p99: int
+
+class DryRunPlanData(TypedDict):
+    articles: int
+    chunked_articles: int
+    completion_requests: int
+    embedding_requests: int
+    prompt_tokens: int
+    embedding_tokens: int
+    prompt_tokens_distribution: TokenDistributionData
+    estimated_completion_seconds: float
+    estimated_embedding_seconds: float
+    estimated_seconds: float
+    completion_bottleneck: str
+    embedding_bottleneck: str
@@ -1,4 +1,5 @@
-from typing import List
+import os
+from typing import List, Optional
 
 import tiktoken
 
@@ -29,4 +30,34 @@ def get_token_length_from_text(text: str, model: str) -> int:
         Returns:
             Un entero representando la cantidad de tokens necesarios para el texto original.
     """
-    return len(get_tokens_from_text(text, model))
\ No newline at end of file
+    return len(get_tokens_from_text(text, model))
+
+def get_token_lengths_from_texts(texts: List[str], model: str, num_threads: Optional[int] = None) -> List[int]:
+    """
+        Calcula la cantidad de tokens de varios textos en paralelo según el modelo de OpenAI a utilizar.
+        La codificación se realiza en lotes mediante tiktoken, el cual libera el GIL y permite utilizar todos los núcleos disponibles.
+
+        Args:
+            texts: Los textos a evaluar.
+            model: El modelo de OpenAI utilizado para realizar las consultas.
+            num_threads: La cantidad de hilos a utilizar. Por defecto se utiliza la cantidad de núcleos del sistema.
+
+        Returns:
+            Una lista de enteros con la cantidad de tokens de cada texto, en el mismo orden que los textos originales.
+    """
+
+    encoder = tiktoken.encoding_for_model(model)
+
+    return [len(tokens) for tokens in encoder.encode_batch(texts, num_threads = num_threads or os.cpu_count() or 1)]
+
+def get_encoding_name_for_model(model: str) -> str:
+    """
+        Obtiene el nombre de la codificación de tiktoken asociada al modelo de OpenAI.
+
+        Args:
+            model: El modelo de OpenAI.
+
+        Returns:
+            El nombre de la codificación utilizada por el modelo. (por ejemplo `cl100k_base`)
+    """
+    return tiktoken.encoding_for_model(model).name
@@ -1,4 +1,10 @@
-from types_ import ChatCompletionRequest
+import math
+import textwrap
+from typing import List, Tuple
+
+from types_ import ChatCompletionRequest, RateLimitsConfig, TokenDistributionData
+
+from .openai import get_token_length_from_text
 
 def get_fragment_extraction_prompt_for_text(model: str, text: str) -> ChatCompletionRequest:
     return {
@@ -18,4 +24,94 @@ def get_fragment_extraction_prompt_for_text(model: str, text: str) -> ChatComple
             'required': ['title', 'summary', 'tags'],
         }],
         'function_call': { 'name': 'get_fragment_data' }
-    }
\ No newline at end of file
+    }
+
+def split_text_into_chunks(text: str, max_tokens: int) -> List[str]:
+    """
+        Separa el texto en partes de acuerdo al máximo de tokens especificado.
+
+        Args:
+            text: El texto a separar.
+            max_tokens: La cantidad máxima de tokens aproximada para cada parte.
+
+        Returns:
+            Una lista con las partes del texto original.
+    """
+
+    # Como regla general especificada por OpenAI, un token corresponde aproximadamente a 4 caracteres.
+    # En este caso se utiliza esa relación para poder separar el texto en partes de acuerdo al máximo de tokens especificado.
+    return textwrap.wrap(text, max_tokens * 4)
+
+def get_chunks_token_lengths_from_text(text: str, max_tokens: int, model: str) -> List[int]:
+    """
+        Separa el texto en partes y calcula la cantidad de tokens de cada una de ellas.
+        Se define a nivel de módulo para poder ser ejecutada en procesos independientes.
+
+        Args:
+            text: El texto a separar.
+            max_tokens: La cantidad máxima de tokens aproximada para cada parte.
+            model: El modelo de OpenAI utilizado para realizar las consultas.
+
+        Returns:
+            Una lista con la cantidad de tokens de cada parte, en el orden en que serían enviadas.
+    """
+    return [get_token_length_from_text(chunk, model) for chunk in split_text_into_chunks(text, max_tokens)]
+
+def get_tokens_distribution(tokens_per_request: List[int]) -> TokenDistributionData:
+    """
+        Calcula la distribución de tokens por request. Los percentiles se obtienen mediante el método de rango más cercano.
+
+        Args:
+            tokens_per_request: La cantidad de tokens de cada request.
+
+        Returns:
+            Un diccionario con el mínimo, máximo, promedio y percentiles 50, 90 y 99.
+    """
+
+    if len(tokens_per_request) == 0:
+        return { 'min': 0, 'max': 0, 'mean': 0.0, 'p50': 0, 'p90': 0, 'p99': 0 }
+
+    sorted_tokens = sorted(tokens_per_request)
+
+    def percentile(value: int) -> int:
+        return sorted_tokens[max(math.ceil(value / 100 * len(sorted_tokens)) - 1, 0)]
+
+    return {
+        'min': sorted_tokens[0],
+        'max': sorted_tokens[-1],
+        'mean': sum(sorted_tokens) / len(sorted_tokens),
+        'p50': percentile(50),
+        'p90': percentile(90),
+        'p99': percentile(99),
+    }
+
+def estimate_run_time_in_seconds(requests: int, tokens: int, rate_limits: RateLimitsConfig) -> Tuple[float, str]:
+    """
+        Estima el tiempo de ejecución de un conjunto de requests según los límites de la API y la concurrencia.
+        El tiempo estimado corresponde al mayor de los tiempos impuestos por cada uno de los límites. Los límites
+        no especificados (o iguales a 0) se consideran ilimitados.
+
+        Args:
+            requests: La cantidad de requests a realizar.
+            tokens: La cantidad total de tokens a enviar.
+            rate_limits: Los límites de requests y tokens por minuto, la concurrencia y la duración promedio de cada request.
+
+        Returns:
+            Una tupla que contiene en primer lugar el tiempo estimado en segundos y en segundo lugar el nombre del límite
+            que lo determina.
+    """
+
+    bounds = { 'none': 0.0 }
+
+    if rate_limits.get('requests_per_minute'):
+        bounds['requests_per_minute'] = requests / rate_limits['requests_per_minute'] * 60
+
+    if rate_limits.get('tokens_per_minute'):
+        bounds['tokens_per_minute'] = tokens / rate_limits['tokens_per_minute'] * 60
+
+    if rate_limits.get('concurrency'):
+        bounds['concurrency'] = requests * rate_limits.get('average_request_seconds', 0) / rate_limits['concurrency']
+
+    bottleneck = max(bounds, key = bounds.get)
+
+    return bounds[bottleneck], bottleneck